@@ -26,23 +26,105 @@ By using this software, you agree to these terms. If you are a company or organi
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime
 from braket.circuits import Circuit
+from braket.circuits.serialization import IRType
 from braket.devices import LocalSimulator
-from braket.aws import AwsDevice
+import sys
 import time
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import json
 
+try:
+   import orjson
+except ImportError:  # orjson is optional, results are then written with json
+   orjson = None
+
+
+# 4x4 unitaries of the demo gate set (qubit 0 is the most significant bit)
+_H = np.array([[1, 1], [1, -1]], dtype=np.complex128) / np.sqrt(2)
+_X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+_I = np.eye(2, dtype=np.complex128)
+_CZ = np.diag([1, 1, 1, -1]).astype(np.complex128)
+
+# Closed-form ideal success of 2-qubit Grover: sin²((2k+1)θ) with sin θ = 1/√4
+_GROVER_THETA = np.arcsin(0.5)
+_ANALYTIC = {k: float(np.sin((2 * k + 1) * _GROVER_THETA) ** 2) for k in (1, 2)}
+
+_GATES = {
+   ('H', (0,)): np.kron(_H, _I),
+   ('H', (1,)): np.kron(_I, _H),
+   ('X', (0,)): np.kron(_X, _I),
+   ('X', (1,)): np.kron(_I, _X),
+   ('CZ', (0, 1)): _CZ,
+   ('CZ', (1, 0)): _CZ,
+}
+
+
+# Progress bar glyphs, sliced to size instead of rebuilt for every bar
+_BAR_MAX_LENGTH = 50
+_BAR_FULL = '█' * _BAR_MAX_LENGTH
+_BAR_EMPTY = '░' * _BAR_MAX_LENGTH
+
+
+def _render_bar(fraction: float, length: int) -> str:
+   """Text progress bar of the given length, filled to fraction"""
+   filled = int(length * fraction)
+   if length > _BAR_MAX_LENGTH:
+      # Longer than the cached glyphs, build this one on demand
+      return '█' * filled + '░' * (length - filled)
+   return _BAR_FULL[:filled] + _BAR_EMPTY[:length - filled]
+
+
+# Devices shared across demo instances, keyed by (platform, device ARN or instance label)
+_DEVICE_CACHE: Dict[tuple, object] = {}
+
+
+def _cached_device(key: tuple, factory):
+   """Return the device stored under key, creating it with factory on first use"""
+   device = _DEVICE_CACHE.get(key)
+   if device is None:
+      device = _DEVICE_CACHE[key] = factory()
+   return device
+
+
+# One executed search: ((target, iterations, circuit) per stage, stage success rates, seconds)
+_SearchExecution = Tuple[List[Tuple[str, int, Circuit]], List[float], float]
+
 
 class QuantumDatabaseDemo:
    """Demonstrate VERMICULAR's advantage in multi-stage searches"""
    
-   def __init__(self, platform: str = 'simulator'):
+   # Circuits shared across demo runs, keyed by (platform, algorithm_type, target, iterations)
+   _circuit_cache: Dict[tuple, Circuit] = {}
+   
+   # Simulator IR translations, keyed by id(circuit) (bounded, oldest evicted first)
+   _ir_cache: "OrderedDict[int, tuple]" = OrderedDict()
+   _ir_cache_size = 32
+   _ir_cache_lock = threading.Lock()
+   
+   # Row of each algorithm in the (algorithms, stages) rates array
+   _ALGORITHMS = {'standard': 0, 'vermicular': 1}
+   
+   def __init__(self, platform: str = 'simulator', fast_simulation: bool = True,
+                shot_noise: bool = False, analytic: bool = True):
        self.platform = platform
+       
+       # Ideal 2-qubit circuits are simulated in-process instead of on LocalSimulator,
+       # reporting exact probabilities (binomially sampled if shot_noise is set).
+       # With analytic set, stage results come straight from the closed form;
+       # disable it to validate against simulating the circuits themselves.
+       self.fast_simulation = fast_simulation and platform == 'simulator'
+       self.shot_noise = shot_noise
+       self.analytic = analytic and self.fast_simulation
        self.setup_device()
        
+       # Each simulated circuit fused into one 4x4 unitary, keyed by id(circuit)
+       self._fused_unitaries: Dict[int, tuple] = {}
+       
        # Password fragments to find (2-bit codes)
        self.targets = [
            ("Alpha", "00"),
@@ -50,57 +132,81 @@ class QuantumDatabaseDemo:
            ("Gamma", "10")
        ]
        
-       # Track results
-       self.results = {
-           'standard': {'stages': [], 'total': 0},
-           'vermicular': {'stages': [], 'total': 0}
+       # Static blocks shared by every circuit built by this demo
+       self._h_layer = Circuit().h(0).h(1)
+       self._diffusion = Circuit().h(0).h(1).x(0).x(1).cz(0, 1).x(0).x(1).h(0).h(1)
+       
+       # Warm the circuit cache with every (algorithm, target, iterations) circuit the demo uses
+       for algorithm in self._ALGORITHMS:
+           for _, target in self.targets:
+               for iterations in (1, 2):
+                   self._get_circuit(algorithm, target, iterations)
+       
+       # Track results: per-stage success rates, one row per algorithm
+       self.rates = np.zeros((len(self._ALGORITHMS), len(self.targets)), dtype=np.float64)
+       self.errors: Dict[str, str] = {}  # Searches that failed, by algorithm
+       
+   @property
+   def results(self) -> Dict[str, Dict]:
+       """Per-algorithm stage rates and totals as plain Python values"""
+       totals = self.rates.prod(axis=1)
+       return {
+           algorithm: {'stages': self.rates[row].tolist(), 'total': float(totals[row])}
+           for algorithm, row in self._ALGORITHMS.items()
        }
-       
+   
    def setup_device(self):
        """Initialize quantum device"""
        if self.platform == 'simulator':
-           self.device = LocalSimulator()
-           self.device_name = "AWS Braket Simulator"
+           # Name what actually produces the numbers, so saved results say so
+           if self.analytic:
+               self.device = None
+               self.device_name = "Ideal Grover (closed form)"
+           elif self.fast_simulation:
+               self.device = None
+               self.device_name = "Ideal Grover (in-process statevector)"
+           else:
+               self.device = _cached_device(('simulator', None), LocalSimulator)
+               self.device_name = "AWS Braket Simulator"
+           if self.shot_noise:
+               self.device_name += " + shot noise"
            self.cost_per_shot = 0
            self.shots_per_test = 1000
-           print(f"Using {self.device_name} (Free)")
-           
-       elif self.platform == 'iqm':
-           self.device = AwsDevice("arn:aws:braket:eu-north-1::device/qpu/iqm/Garnet")
+           sys.stdout.write(f"Using {self.device_name} (Free)\n")
+           return
+       
+       # Deferred: the AWS SDK import is slow and only needed for real hardware
+       from braket.aws import AwsDevice
+       
+       if self.platform == 'iqm':
+           arn = "arn:aws:braket:eu-north-1::device/qpu/iqm/Garnet"
+           self.device = _cached_device((self.platform, arn), lambda: AwsDevice(arn))
            self.device_name = "IQM Garnet"
            self.cost_per_shot = 0.00035
            self.shots_per_test = 200
-           print(f"Using {self.device_name} (~${self.shots_per_test * self.cost_per_shot * 12:.2f} per run)")
+           sys.stdout.write(f"Using {self.device_name} (~${self.shots_per_test * self.cost_per_shot * 12:.2f} per run)\n")
            
        elif self.platform == 'rigetti':
-           self.device = AwsDevice("arn:aws:braket:us-west-1::device/qpu/rigetti/Ankaa-3")
+           arn = "arn:aws:braket:us-west-1::device/qpu/rigetti/Ankaa-3"
+           self.device = _cached_device((self.platform, arn), lambda: AwsDevice(arn))
            self.device_name = "Rigetti Ankaa-3" 
            self.cost_per_shot = 0.00035
            self.shots_per_test = 200
-           print(f"Using {self.device_name} (~${self.shots_per_test * self.cost_per_shot * 12:.2f} per run)")
+           sys.stdout.write(f"Using {self.device_name} (~${self.shots_per_test * self.cost_per_shot * 12:.2f} per run)\n")
            
    def create_standard_grover(self, target: str, iterations: int = 1) -> Circuit:
        """Standard Grover without optimization"""
        circuit = Circuit()
        
        # Initial superposition
-       circuit.h(0)
-       circuit.h(1)
+       circuit.add_circuit(self._h_layer)
        
        for _ in range(iterations):
            # Oracle for target
            self._apply_oracle(circuit, target)
            
            # Diffusion operator
-           circuit.h(0)
-           circuit.h(1)
-           circuit.x(0)
-           circuit.x(1)
-           circuit.cz(0, 1)
-           circuit.x(0)
-           circuit.x(1)
-           circuit.h(0)
-           circuit.h(1)
+           circuit.add_circuit(self._diffusion)
            
        return circuit
    
@@ -109,44 +215,37 @@ class QuantumDatabaseDemo:
        circuit = Circuit()
        
        # Initial superposition
-       circuit.h(0)
-       circuit.h(1)
+       circuit.add_circuit(self._h_layer)
        
        # Pre-oracle DD sequence (KEY INNOVATION!)
-       circuit.x(0)
-       circuit.x(0)
-       circuit.x(1)
-       circuit.x(1)
+       self._apply_dd_sequence(circuit)
        
        for _ in range(iterations):
            # Oracle
            self._apply_oracle(circuit, target)
            
            # Diffusion
-           circuit.h(0)
-           circuit.h(1)
-           circuit.x(0)
-           circuit.x(1)
-           circuit.cz(0, 1)
-           circuit.x(0)
-           circuit.x(1)
-           circuit.h(0)
-           circuit.h(1)
+           circuit.add_circuit(self._diffusion)
            
            # Inter-iteration DD (if multiple iterations)
            if iterations > 1 and _ < iterations - 1:
-               circuit.x(0)
-               circuit.x(0)
-               circuit.x(1)
-               circuit.x(1)
+               self._apply_dd_sequence(circuit)
        
        # Post-diffusion DD (CRITICAL!)
+       self._apply_dd_sequence(circuit)
+       
+       return circuit
+   
+   def _apply_dd_sequence(self, circuit: Circuit):
+       """Apply XX decoupling sequence (skipped on the ideal simulator)"""
+       # X·X = I, so DD only matters where there is noise to suppress
+       if self.platform == 'simulator':
+           return
+       
        circuit.x(0)
        circuit.x(0)
        circuit.x(1)
        circuit.x(1)
-       
-       return circuit
    
    def _apply_oracle(self, circuit: Circuit, target: str):
        """Apply oracle for target state"""
@@ -163,102 +262,244 @@ class QuantumDatabaseDemo:
            if bit == '0':
                circuit.x(i)
    
+   def _get_circuit(self, algorithm_type: str, target: str, iterations: int) -> Circuit:
+       """Return cached circuit, building it on first use"""
+       key = (self.platform, algorithm_type, target, iterations)
+       circuit = self._circuit_cache.get(key)
+       if circuit is None:
+           if algorithm_type == 'standard':
+               circuit = self.create_standard_grover(target, iterations)
+           else:
+               circuit = self.create_vermicular(target, iterations)
+           self._circuit_cache[key] = circuit
+       return circuit
+   
+   def _task_spec(self, circuit: Circuit):
+       """
+       Return task specification for circuit
+       
+       On the simulator the circuit is translated once to OpenQASM, with a
+       Probability result type so the task returns exact outcome probabilities.
+       """
+       if self.platform != 'simulator':
+           return circuit
+       
+       key = id(circuit)
+       with self._ir_cache_lock:
+           entry = self._ir_cache.get(key)
+           if entry is None or entry[0] is not circuit:
+               # Keep the circuit alongside its IR so the id cannot be reused
+               entry = (circuit, circuit.copy().probability().to_ir(IRType.OPENQASM))
+               self._ir_cache[key] = entry
+               if len(self._ir_cache) > self._ir_cache_size:
+                   self._ir_cache.popitem(last=False)
+           else:
+               self._ir_cache.move_to_end(key)
+       
+       return entry[1]
+   
+   @property
+   def _task_shots(self) -> int:
+       """Shots per device task (0 on the simulator, which returns exact probabilities)"""
+       return 0 if self.platform == 'simulator' else self.shots_per_test
+   
+   def _run_batch(self, circuits: List[Circuit], shots: int, device=None) -> list:
+       """Submit circuits (as one task batch on QPUs) and return their results in order"""
+       device = device or self.device
+       if self.platform == 'simulator':
+           # LocalSimulator.run_batch spins up a process pool, which costs more
+           # than a few small in-process runs
+           return [device.run(self._task_spec(c), shots=shots).result() for c in circuits]
+       
+       batch = device.run_batch([self._task_spec(c) for c in circuits], shots=shots)
+       
+       # No automatic resubmission on QPUs: retries would be charged beyond the
+       # cost the user confirmed, so fail loudly instead
+       return batch.results(fail_unsuccessful=True, max_retries=0)
+   
+   def _ideal_rate(self, prob_target: float) -> float:
+       """Success rate from the exact target probability, optionally with shot noise"""
+       # Drop float round-off so an ideal 1.0 is not reported (or sampled) as 0.999...
+       prob_target = round(prob_target, 12)
+       if self.shot_noise:
+           return np.random.binomial(self.shots_per_test, prob_target) / self.shots_per_test
+       return prob_target
+   
+   def _ideal_stage_rate(self, target: str, iterations: int, circuit: Circuit) -> float:
+       """Success rate of an ideal Grover stage, from the closed form where available"""
+       if self.analytic and iterations in _ANALYTIC:
+           return self._ideal_rate(_ANALYTIC[iterations])
+       return self.measure_success_rate(circuit, target)
+   
+   def _fast_simulate(self, circuit: Circuit) -> Optional[np.ndarray]:
+       """Outcome probabilities of a 2-qubit demo circuit without the device (None if unsupported)"""
+       entry = self._fused_unitaries.get(id(circuit))
+       if entry is None or entry[0] is not circuit or entry[1] != len(circuit.instructions):
+           keys = [(instr.operator.name, tuple(int(q) for q in instr.target)) for instr in circuit.instructions]
+           if any(key not in _GATES for key in keys):
+               return None
+           
+           # Fuse the whole circuit once; later calls are a single column read
+           unitary = np.eye(4, dtype=np.complex128)
+           for key in keys:
+               unitary = _GATES[key] @ unitary
+           entry = (circuit, len(circuit.instructions), unitary)
+           self._fused_unitaries[id(circuit)] = entry
+       
+       # Column 0 is the circuit applied to |00⟩
+       return np.abs(entry[2][:, 0]) ** 2
+   
    def measure_success_rate(self, circuit: Circuit, target: str) -> float:
        """Measure how often we find the target"""
-       result = self.device.run(circuit, shots=self.shots_per_test).result()
-       measurements = result.measurements
-       
-       # Count successful finds
-       success_count = 0
-       for measurement in measurements:
-           measured_string = ''.join(str(int(bit)) for bit in measurement)
-           if measured_string == target:
-               success_count += 1
+       if self.fast_simulation:
+           probabilities = self._fast_simulate(circuit)
+           if probabilities is not None:
+               return self._ideal_rate(float(probabilities[int(target, 2)]))
+       
+       if self.device is None:
+           # Circuits outside the in-process gate table still need the simulator
+           self.device = _cached_device(('simulator', None), LocalSimulator)
+       
+       result = self.device.run(self._task_spec(circuit), shots=self._task_shots).result()
+       return self._result_rate(result, target)
+   
+   def _measure_stages(self, stages: List[Tuple[str, int, Circuit]], device=None) -> List[float]:
+       """Success rate of every (target, iterations, circuit) stage, batching submissions to the device"""
+       if self.fast_simulation:
+           return [self._ideal_stage_rate(target, iterations, circuit) for target, iterations, circuit in stages]
+       
+       batch_results = self._run_batch([c for _, _, c in stages], self._task_shots, device)
+       return [self._result_rate(r, t) for (t, _, _), r in zip(stages, batch_results)]
+   
+   def _result_rate(self, result, target: str) -> float:
+       """Success rate from a device task result"""
+       if self.platform == 'simulator':
+           # Exact probabilities from the Probability result type, no shot sampling
+           return self._ideal_rate(float(result.values[0][int(target, 2)]))
+       return self._success_rate(result.measurements, target)
+   
+   def _success_rate(self, measurements, target: str) -> float:
+       """Fraction of measurement rows equal to the target bitstring"""
+       measurements = np.asarray(measurements, dtype=np.uint8)
+       
+       # Count successful finds (rows matching the target bitstring)
+       target_bits = np.frombuffer(target.encode(), dtype=np.uint8) - ord('0')
+       success_count = int((measurements == target_bits).all(axis=1).sum())
                
        return success_count / len(measurements)
    
-   def run_multi_stage_search(self, algorithm_type: str = 'standard'):
-       """Run complete 3-stage search"""
-       print(f"\n{'='*60}")
-       print(f"{algorithm_type.upper()} GROVER - Multi-Stage Search")
-       print(f"{'='*60}")
-       
-       stage_results = []
+   def _execute_search(self, algorithm_type: str, device=None) -> _SearchExecution:
+       """
+       Build and measure all stages of one search without printing or storing results
+       
+       Safe to call from a worker thread. Returns (stages, stage_results, elapsed).
+       """
+       # Build all stages up front so they can be submitted as one batch
+       stages = []
        cumulative_depth = 0
        
-       for stage, (name, target) in enumerate(self.targets):
-           print(f"\nStage {stage + 1}: Searching for {name} ({target})...")
-           
+       for name, target in self.targets:
            # Create circuit based on type
            if algorithm_type == 'standard':
                # Standard might need different iterations based on depth
                iterations = 1 if cumulative_depth < 2 else 2  # Compensate for degradation
-               circuit = self.create_standard_grover(target, iterations)
            else:
                # VERMICULAR uses consistent iterations
-               circuit = self.create_vermicular(target, 1)
-           
-           # Measure performance
-           start_time = time.time()
-           success_rate = self.measure_success_rate(circuit, target)
-           elapsed = time.time() - start_time
-           
-           stage_results.append(success_rate)
+               iterations = 1
+           circuit = self._get_circuit(algorithm_type, target, iterations)
+           stages.append((target, iterations, circuit))
+           cumulative_depth += len(circuit.instructions)
+       
+       # Measure performance
+       start_time = time.time()
+       stage_results = self._measure_stages(stages, device)
+       elapsed = time.time() - start_time
+       
+       return stages, stage_results, elapsed
+   
+   def run_multi_stage_search(self, algorithm_type: str = 'standard'):
+       """Run complete 3-stage search"""
+       return self._report_search(algorithm_type, self._execute_search(algorithm_type))
+   
+   def _report_search(self, algorithm_type: str, execution: _SearchExecution):
+       """Print and store the results of an executed search"""
+       # Output is collected and written once per block to avoid per-line flushes
+       out = [
+           f"\n{'='*60}",
+           f"{algorithm_type.upper()} GROVER - Multi-Stage Search",
+           f"{'='*60}",
+       ]
+       sys.stdout.write('\n'.join(out) + '\n')
+       
+       stages, stage_results, elapsed = execution
+       sys.stdout.write(f"\nExecuted {len(stages)} stages in {elapsed:.2f}s\n")
+       
+       cumulative_depth = 0
+       
+       for stage, ((name, target), (_, _, circuit), success_rate) in enumerate(zip(self.targets, stages, stage_results)):
            cumulative_depth += len(circuit.instructions)
            
            # Display results
-           print(f"  Target: |{target}⟩")
-           print(f"  Success Rate: {success_rate:.1%}")
-           print(f"  Circuit Depth: {len(circuit.instructions)}")
-           print(f"  Cumulative Depth: {cumulative_depth}")
-           print(f"  Time: {elapsed:.2f}s")
-           
-           # Visual progress bar
-           bar_length = 50
-           filled = int(bar_length * success_rate)
-           bar = '█' * filled + '░' * (bar_length - filled)
-           print(f"  [{bar}] {success_rate:.1%}")
+           out = [
+               f"\nStage {stage + 1}: Searching for {name} ({target})...",
+               f"  Target: |{target}⟩",
+               f"  Success Rate: {success_rate:.1%}",
+               f"  Circuit Depth: {len(circuit.instructions)}",
+               f"  Cumulative Depth: {cumulative_depth}",
+               f"  [{_render_bar(success_rate, _BAR_MAX_LENGTH)}] {success_rate:.1%}",
+           ]
+           sys.stdout.write('\n'.join(out) + '\n')
            
        # Calculate total success
-       total_success = np.prod(stage_results)
-       
-       print(f"\n{'='*40}")
-       print(f"FINAL RESULTS - {algorithm_type.upper()}")
-       print(f"{'='*40}")
-       print(f"Stage Success Rates: {[f'{r:.1%}' for r in stage_results]}")
-       print(f"Total Success (all 3 stages): {total_success:.1%}")
+       total_success = float(np.prod(np.asarray(stage_results)))
+       
+       out = [
+           f"\n{'='*40}",
+           f"FINAL RESULTS - {algorithm_type.upper()}",
+           f"{'='*40}",
+           f"Stage Success Rates: {[f'{r:.1%}' for r in stage_results]}",
+           f"Total Success (all 3 stages): {total_success:.1%}",
+       ]
+       sys.stdout.write('\n'.join(out) + '\n')
        
        # Store results
-       self.results[algorithm_type] = {
-           'stages': stage_results,
-           'total': total_success
-       }
+       self.rates[self._ALGORITHMS[algorithm_type]] = stage_results
        
        return stage_results, total_success
    
    def run_complete_demo(self):
        """Run full comparison demo"""
-       print(f"\n{'='*70}")
-       print("QUANTUM DATABASE MULTI-STAGE SEARCH DEMO")
-       print(f"{'='*70}")
-       print(f"Platform: {self.device_name}")
-       print(f"Task: Find 3 password fragments in sequence")
-       print(f"Challenge: Maintain performance across multiple searches")
+       out = [
+           f"\n{'='*70}",
+           "QUANTUM DATABASE MULTI-STAGE SEARCH DEMO",
+           f"{'='*70}",
+           f"Platform: {self.device_name}",
+           f"Task: Find 3 password fragments in sequence",
+           f"Challenge: Maintain performance across multiple searches",
+       ]
+       sys.stdout.write('\n'.join(out) + '\n')
        
        # Cost warning for real hardware
        if self.platform != 'simulator':
            total_cost = self.shots_per_test * self.cost_per_shot * 12  # 6 circuits, 2 algorithms
-           print(f"\n⚠️  Estimated cost: ${total_cost:.2f}")
+           sys.stdout.write(f"\n⚠️  Estimated cost: ${total_cost:.2f}\n")
            confirm = input("Proceed? (yes/no): ")
            if confirm.lower() != 'yes':
-               print("Demo cancelled")
+               sys.stdout.write("Demo cancelled\n")
                return
        
-       # Run standard Grover
-       standard_stages, standard_total = self.run_multi_stage_search('standard')
+       executions, errors = self._execute_searches()
        
-       # Run VERMICULAR
-       vermicular_stages, vermicular_total = self.run_multi_stage_search('vermicular')
+       # Report standard Grover, then VERMICULAR
+       for algorithm_type in self._ALGORITHMS:
+           if algorithm_type in executions:
+               self._report_search(algorithm_type, executions[algorithm_type])
+       
+       if errors:
+           # Keep the search that did complete (and was paid for) before failing
+           self.errors = {algorithm_type: repr(e) for algorithm_type, e in errors.items()}
+           self.save_results()
+           raise next(iter(errors.values()))
        
        # Final comparison
        self.display_final_comparison()
@@ -269,62 +510,97 @@ class QuantumDatabaseDemo:
        # Save results
        self.save_results()
    
+   def _execute_searches(self) -> Tuple[Dict[str, _SearchExecution], Dict[str, Exception]]:
+       """
+       Execute both algorithms' searches
+       
+       Returns the executions that completed and the errors of those that failed.
+       """
+       if self.fast_simulation:
+           # Stages are in-process lookups, threads would only add overhead
+           return {a: self._execute_search(a) for a in self._ALGORITHMS}, {}
+       
+       # Execute both algorithms concurrently; device I/O releases the GIL
+       if self.platform == 'simulator':
+           # Separate instance so the two searches do not queue on one simulator
+           vermicular_device = _cached_device(('simulator', 'worker'), LocalSimulator)
+       else:
+           vermicular_device = self.device
+       
+       with ThreadPoolExecutor(max_workers=2) as executor:
+           futures = {
+               'standard': executor.submit(self._execute_search, 'standard'),
+               'vermicular': executor.submit(self._execute_search, 'vermicular', vermicular_device),
+           }
+       
+       # Collect each search on its own so one failure does not discard the other
+       executions, errors = {}, {}
+       for algorithm_type, future in futures.items():
+           try:
+               executions[algorithm_type] = future.result()
+           except Exception as e:
+               errors[algorithm_type] = e
+       return executions, errors
+   
    def display_final_comparison(self):
        """Display final comparison between algorithms"""
-       print(f"\n{'='*70}")
-       print("FINAL COMPARISON")
-       print(f"{'='*70}")
+       out = [
+           f"\n{'='*70}",
+           "FINAL COMPARISON",
+           f"{'='*70}",
+       ]
        
-       standard = self.results['standard']
-       vermicular = self.results['vermicular']
+       std_rates = self.rates[self._ALGORITHMS['standard']]
+       ver_rates = self.rates[self._ALGORITHMS['vermicular']]
+       std_total, ver_total = self.rates.prod(axis=1)
        
        # Stage-by-stage comparison
-       print("\nStage-by-Stage Success Rates:")
-       print(f"{'Stage':<10} {'Target':<10} {'Standard':<15} {'VERMICULAR':<15} {'Advantage':<10}")
-       print("-" * 70)
+       with np.errstate(divide='ignore', invalid='ignore'):
+           advantages = np.where(std_rates > 0, ver_rates / std_rates, np.inf)
+       
+       out.append("\nStage-by-Stage Success Rates:")
+       out.append(f"{'Stage':<10} {'Target':<10} {'Standard':<15} {'VERMICULAR':<15} {'Advantage':<10}")
+       out.append("-" * 70)
        
        for i, (name, target) in enumerate(self.targets):
-           std_rate = standard['stages'][i]
-           ver_rate = vermicular['stages'][i]
-           advantage = ver_rate / std_rate if std_rate > 0 else float('inf')
-           
-           print(f"{i+1:<10} {name:<10} {std_rate:<15.1%} {ver_rate:<15.1%} {advantage:<10.1f}x")
+           out.append(f"{i+1:<10} {name:<10} {std_rates[i]:<15.1%} {ver_rates[i]:<15.1%} {advantages[i]:<10.1f}x")
        
-       print("-" * 70)
+       out.append("-" * 70)
        
        # Total comparison
-       improvement = vermicular['total'] / standard['total'] if standard['total'] > 0 else float('inf')
+       improvement = ver_total / std_total if std_total > 0 else float('inf')
        
-       print(f"\nTOTAL SUCCESS RATES:")
-       print(f"  Standard Grover:  {standard['total']:.1%}")
-       print(f"  VERMICULAR:       {vermicular['total']:.1%}")
-       print(f"  Improvement:      {improvement:.1f}x")
+       out.append(f"\nTOTAL SUCCESS RATES:")
+       out.append(f"  Standard Grover:  {std_total:.1%}")
+       out.append(f"  VERMICULAR:       {ver_total:.1%}")
+       out.append(f"  Improvement:      {improvement:.1f}x")
        
        # Visual comparison
-       print("\nVisual Summary:")
-       self._print_visual_bars(standard['total'], vermicular['total'])
+       out.append("\nVisual Summary:")
+       sys.stdout.write('\n'.join(out) + '\n')
+       self._print_visual_bars(std_total, ver_total)
        
        # Key insight
        if improvement > 2:
-           print(f"\n🎉 VERMICULAR is {improvement:.0f}x more reliable for multi-stage searches!")
+           sys.stdout.write(f"\n🎉 VERMICULAR is {improvement:.0f}x more reliable for multi-stage searches!\n")
        else:
-           print(f"\n📊 Both algorithms show similar performance on {self.device_name}")
+           sys.stdout.write(f"\n📊 Both algorithms show similar performance on {self.device_name}\n")
    
    def _print_visual_bars(self, standard: float, vermicular: float):
        """Print visual comparison bars"""
        bar_length = 40
        
-       std_filled = int(bar_length * standard)
-       ver_filled = int(bar_length * vermicular)
-       
-       std_bar = '█' * std_filled + '░' * (bar_length - std_filled)
-       ver_bar = '█' * ver_filled + '░' * (bar_length - ver_filled)
+       std_bar = _render_bar(standard, bar_length)
+       ver_bar = _render_bar(vermicular, bar_length)
        
-       print(f"\nStandard:   [{std_bar}] {standard:.1%}")
-       print(f"VERMICULAR: [{ver_bar}] {vermicular:.1%}")
+       sys.stdout.write(f"\nStandard:   [{std_bar}] {standard:.1%}\n"
+                        f"VERMICULAR: [{ver_bar}] {vermicular:.1%}\n")
    
    def create_comparison_plot(self):
        """Create visualization of results"""
+       # Deferred: pyplot import is costly and only needed once results exist
+       import matplotlib.pyplot as plt
+       
        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
        
        stages = [f"Stage {i+1}\n{name}" for i, (name, _) in enumerate(self.targets)]
@@ -333,8 +609,8 @@ class QuantumDatabaseDemo:
        x = np.arange(len(stages))
        width = 0.35
        
-       std_stages = self.results['standard']['stages']
-       ver_stages = self.results['vermicular']['stages']
+       std_stages = self.rates[self._ALGORITHMS['standard']]
+       ver_stages = self.rates[self._ALGORITHMS['vermicular']]
        
        bars1 = ax1.bar(x - width/2, std_stages, width, label='Standard', color='blue', alpha=0.7)
        bars2 = ax1.bar(x + width/2, ver_stages, width, label='VERMICULAR', color='green', alpha=0.7)
@@ -355,12 +631,7 @@ class QuantumDatabaseDemo:
                        f'{height:.0%}', ha='center', va='bottom')
        
        # Cumulative success
-       std_cumulative = [std_stages[0]]
-       ver_cumulative = [ver_stages[0]]
-       
-       for i in range(1, len(std_stages)):
-           std_cumulative.append(std_cumulative[-1] * std_stages[i])
-           ver_cumulative.append(ver_cumulative[-1] * ver_stages[i])
+       std_cumulative, ver_cumulative = np.cumprod(self.rates, axis=1)
        
        ax2.plot(range(1, len(stages) + 1), std_cumulative, 'b-o', 
                label='Standard', linewidth=2, markersize=8)
@@ -387,42 +658,54 @@ class QuantumDatabaseDemo:
        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
        filename = f"vermicular_demo_{self.platform}_{timestamp}.png"
        plt.savefig(filename, dpi=300, bbox_inches='tight')
-       print(f"\nPlot saved to: {filename}")
+       sys.stdout.write(f"\nPlot saved to: {filename}\n")
        plt.show()
    
    def save_results(self):
        """Save results to JSON"""
        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
        
+       results = self.results
+       
        results_data = {
            'platform': self.platform,
            'device': self.device_name,
+           'fast_simulation': self.fast_simulation,
+           'analytic': self.analytic,
+           'shot_noise': self.shot_noise,
            'timestamp': timestamp,
-           'targets': self.targets,
-           'results': self.results,
-           'improvement_factor': self.results['vermicular']['total'] / self.results['standard']['total'] 
-                                if self.results['standard']['total'] > 0 else None
+           'targets': [list(t) for t in self.targets],
+           'results': results,
+           'improvement_factor': results['vermicular']['total'] / results['standard']['total'] 
+                                if results['standard']['total'] > 0 and not self.errors else None
        }
+       if self.errors:
+           results_data['errors'] = self.errors
        
        filename = f"vermicular_demo_results_{self.platform}_{timestamp}.json"
-       with open(filename, 'w') as f:
-           json.dump(results_data, f, indent=2)
+       if orjson is not None:
+           with open(filename, 'wb') as f:
+               f.write(orjson.dumps(results_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+       else:
+           with open(filename, 'w') as f:
+               json.dump(results_data, f, indent=2)
        
-       print(f"Results saved to: {filename}")
+       sys.stdout.write(f"Results saved to: {filename}\n")
 
 
 def main():
    """Run the demonstration"""
-   print("VERMICULAR - Multi-Stage Quantum Search Demonstration")
-   print("=====================================================\n")
-   
-   print("This demo shows VERMICULAR's advantage for chained quantum searches")
-   print("Task: Find 3 password fragments using sequential Grover searches\n")
-   
-   print("Select platform:")
-   print("1. AWS Simulator (free, instant)")
-   print("2. IQM Garnet (real quantum computer, ~$0.50)")
-   print("3. Rigetti Ankaa-3 (real quantum computer, ~$0.50)")
+   out = [
+       "VERMICULAR - Multi-Stage Quantum Search Demonstration",
+       "=====================================================\n",
+       "This demo shows VERMICULAR's advantage for chained quantum searches",
+       "Task: Find 3 password fragments using sequential Grover searches\n",
+       "Select platform:",
+       "1. AWS Simulator (free, instant)",
+       "2. IQM Garnet (real quantum computer, ~$0.50)",
+       "3. Rigetti Ankaa-3 (real quantum computer, ~$0.50)",
+   ]
+   sys.stdout.write('\n'.join(out) + '\n')
    
    choice = input("\nYour choice (1-3): ")
    
@@ -438,12 +721,15 @@ def main():
    demo = QuantumDatabaseDemo(platform)
    demo.run_complete_demo()
    
-   print("\n" + "="*70)
-   print("DEMO COMPLETE!")
-   print("="*70)
-   print("\nKey Takeaway:")
-   print("VERMICULAR maintains consistent performance across multiple stages,")
-   print("while standard Grover shows unpredictable degradation with depth.")
+   out = [
+       "\n" + "="*70,
+       "DEMO COMPLETE!",
+       "="*70,
+       "\nKey Takeaway:",
+       "VERMICULAR maintains consistent performance across multiple stages,",
+       "while standard Grover shows unpredictable degradation with depth.",
+   ]
+   sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == "__main__":